@@ -9,13 +9,17 @@ https://github.com/sjafferali/lightstack-homeassistant
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
 
 from .const import (
@@ -36,7 +40,11 @@ from .websocket import LightStackConnectionError, LightStackWebSocket
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Service schemas
+# Compiled once at import; Home Assistant validates call.data against these
+# before invoking the handlers, so handlers read call.data directly.
 TRIGGER_ALERT_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_ALERT_KEY): cv.string,
@@ -59,14 +67,22 @@ CLEAR_ALL_ALERTS_SCHEMA = vol.Schema(
 )
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the LightStack component."""
+    hass.data.setdefault(DOMAIN, {})
+    _LOGGER.info(STARTUP_MESSAGE)
+
+    # Services are registered once for the domain and dispatch to whichever
+    # entries are loaded at call time
+    await _async_setup_services(hass)
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LightStack from a config entry."""
     _LOGGER.debug("Starting LightStack setup for entry: %s", entry.entry_id)
 
-    if hass.data.get(DOMAIN) is None:
-        hass.data.setdefault(DOMAIN, {})
-        _LOGGER.info(STARTUP_MESSAGE)
-
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     _LOGGER.debug("Configuring LightStack connection to %s:%s", host, port)
@@ -97,75 +113,95 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store coordinator for platforms
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    # Register services (only once for the domain)
-    await _async_setup_services(hass)
+    # Start platform setup eagerly and finish the remaining setup while the
+    # platforms load
+    forward_task = hass.async_create_task(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        eager_start=True,
+    )
 
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    await forward_task
+
     return True
 
 
+def _get_coordinators(hass: HomeAssistant) -> list[LightStackCoordinator]:
+    """Return all loaded coordinators.
+
+    hass.data[DOMAIN] only ever holds coordinators keyed by entry_id.
+
+    Raises:
+        HomeAssistantError: If no LightStack entry is loaded.
+    """
+    coordinators: dict[str, LightStackCoordinator] = hass.data[DOMAIN]
+    if not coordinators:
+        raise HomeAssistantError("No LightStack instance is loaded")
+    return list(coordinators.values())
+
+
+async def _async_dispatch(calls: Iterable[Awaitable[Any]]) -> None:
+    """Run service calls against every instance concurrently.
+
+    All calls are allowed to finish; the first failure is then re-raised so
+    the service call still reports it.
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 async def _async_setup_services(hass: HomeAssistant) -> None:
     """Set up LightStack services."""
-    # Check if services are already registered
-    if hass.services.has_service(DOMAIN, SERVICE_TRIGGER_ALERT):
-        return
 
-    async def handle_trigger_alert(call: ServiceCall) -> None:
-        """Handle the trigger_alert service call."""
-        alert_key = call.data[ATTR_ALERT_KEY]
-        priority = call.data.get(ATTR_PRIORITY)
-        note = call.data.get(ATTR_NOTE)
-
-        # Get the first coordinator (services apply to all instances)
-        for coordinator in hass.data[DOMAIN].values():
-            if isinstance(coordinator, LightStackCoordinator):
-                await coordinator.async_trigger_alert(alert_key, priority, note)
-                break
-
-    async def handle_clear_alert(call: ServiceCall) -> None:
-        """Handle the clear_alert service call."""
-        alert_key = call.data[ATTR_ALERT_KEY]
-        note = call.data.get(ATTR_NOTE)
-
-        for coordinator in hass.data[DOMAIN].values():
-            if isinstance(coordinator, LightStackCoordinator):
-                await coordinator.async_clear_alert(alert_key, note)
-                break
-
-    async def handle_clear_all_alerts(call: ServiceCall) -> None:
-        """Handle the clear_all_alerts service call."""
-        note = call.data.get(ATTR_NOTE)
-
-        for coordinator in hass.data[DOMAIN].values():
-            if isinstance(coordinator, LightStackCoordinator):
-                await coordinator.async_clear_all_alerts(note)
-                break
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TRIGGER_ALERT,
-        handle_trigger_alert,
-        schema=TRIGGER_ALERT_SCHEMA,
-    )
+    def make_handler(
+        method: Callable[..., Awaitable[Any]], fields: tuple[str, ...]
+    ) -> Callable[[ServiceCall], Awaitable[None]]:
+        """Build a handler calling a coordinator method on every instance.
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CLEAR_ALERT,
-        handle_clear_alert,
-        schema=CLEAR_ALERT_SCHEMA,
-    )
+        Fields are passed positionally from call.data, with None for any
+        optional field that was omitted.
+        """
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CLEAR_ALL_ALERTS,
-        handle_clear_all_alerts,
-        schema=CLEAR_ALL_ALERTS_SCHEMA,
-    )
+        async def handle(call: ServiceCall) -> None:
+            """Handle the service call."""
+            args = [call.data.get(name) for name in fields]
+
+            await _async_dispatch(
+                method(coordinator, *args) for coordinator in _get_coordinators(hass)
+            )
+
+        return handle
+
+    for service, schema, method, fields in (
+        (
+            SERVICE_TRIGGER_ALERT,
+            TRIGGER_ALERT_SCHEMA,
+            LightStackCoordinator.async_trigger_alert,
+            (ATTR_ALERT_KEY, ATTR_PRIORITY, ATTR_NOTE),
+        ),
+        (
+            SERVICE_CLEAR_ALERT,
+            CLEAR_ALERT_SCHEMA,
+            LightStackCoordinator.async_clear_alert,
+            (ATTR_ALERT_KEY, ATTR_NOTE),
+        ),
+        (
+            SERVICE_CLEAR_ALL_ALERTS,
+            CLEAR_ALL_ALERTS_SCHEMA,
+            LightStackCoordinator.async_clear_all_alerts,
+            (ATTR_NOTE,),
+        ),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            make_handler(method, fields),
+            schema=schema,
+        )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -178,16 +214,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator: LightStackCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
         await coordinator.async_shutdown()
 
-        # Unregister services if no more entries
-        if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, SERVICE_TRIGGER_ALERT)
-            hass.services.async_remove(DOMAIN, SERVICE_CLEAR_ALERT)
-            hass.services.async_remove(DOMAIN, SERVICE_CLEAR_ALL_ALERTS)
-
     return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
+    """Reload config entry.
+
+    Only the host and port affect the WebSocket connection, so when those are
+    unchanged the reload is skipped rather than tearing down and
+    re-establishing the connection. The integration has no options that
+    change runtime behaviour, so options-only updates are deliberately
+    ignored.
+    """
+    coordinator: LightStackCoordinator | None = hass.data[DOMAIN].get(entry.entry_id)
+    if (
+        coordinator is not None
+        and coordinator.websocket.host == entry.data[CONF_HOST]
+        and coordinator.websocket.port == entry.data[CONF_PORT]
+    ):
+        _LOGGER.debug("LightStack connection unchanged, skipping reload")
+        return
+
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import ATTR_ACTIVE_COUNT, DOMAIN, ICON_ALERT_CIRCLE, ICON_CHECK_CIRCLE
@@ -42,6 +40,11 @@ class LightStackAlertActiveSensor(LightStackEntity, BinarySensorEntity):
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_alert_active"
 
+    async def async_added_to_hass(self) -> None:
+        """Compute the cached attributes before the first state write."""
+        self._update_attrs()
+        await super().async_added_to_hass()
+
     @property
     def is_on(self) -> bool:
         """Return True if any alert is active."""
@@ -49,17 +52,16 @@ class LightStackAlertActiveSensor(LightStackEntity, BinarySensorEntity):
             return False
         return not self.coordinator.data.is_all_clear
 
-    @property
-    def icon(self) -> str:
-        """Return the icon based on alert status."""
-        return ICON_ALERT_CIRCLE if self.is_on else ICON_CHECK_CIRCLE
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        if self.coordinator.data is None:
-            return {ATTR_ACTIVE_COUNT: 0}
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
-        return {
-            ATTR_ACTIVE_COUNT: self.coordinator.data.active_count,
+    def _update_attrs(self) -> None:
+        """Cache the icon and state attributes for the current data."""
+        data = self.coordinator.data
+        self._attr_icon = ICON_ALERT_CIRCLE if self.is_on else ICON_CHECK_CIRCLE
+        self._attr_extra_state_attributes = {
+            ATTR_ACTIVE_COUNT: data.active_count if data is not None else 0,
         }
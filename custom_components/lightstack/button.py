@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -10,6 +12,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN, ICON_CLEAR_ALL
 from .coordinator import LightStackCoordinator
 from .entity import LightStackEntity
+from .websocket import LightStackWebSocketError
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -38,7 +43,18 @@ class LightStackClearAllButton(LightStackEntity, ButtonEntity):
         self._attr_unique_id = f"{entry_id}_clear_all"
 
     async def async_press(self) -> None:
-        """Handle the button press."""
-        await self.coordinator.async_clear_all_alerts(
-            note="Cleared via Home Assistant button"
-        )
+        """Handle the button press.
+
+        The clear is sent in the background so the press returns without
+        waiting for the WebSocket round trip; failures are logged instead.
+        """
+        self.hass.async_create_task(self._async_clear_all_alerts(), eager_start=True)
+
+    async def _async_clear_all_alerts(self) -> None:
+        """Clear all alerts, logging any failure."""
+        try:
+            await self.coordinator.async_clear_all_alerts(
+                note="Cleared via Home Assistant button"
+            )
+        except LightStackWebSocketError as err:
+            _LOGGER.error("Failed to clear all LightStack alerts: %s", err)
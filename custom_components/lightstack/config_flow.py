@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import voluptuous as vol
 
-from .const import CONF_HOST, CONF_PORT, DEFAULT_HOST, DEFAULT_PORT, DOMAIN, NAME
+from .const import (
+    CONF_HOST,
+    CONF_PORT,
+    CONNECTION_TIMEOUT,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DOMAIN,
+    NAME,
+)
 from .websocket import LightStackConnectionError, LightStackWebSocket
 
 _LOGGER = logging.getLogger(__name__)
 
+USER_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema({})
+
 
 class LightStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for LightStack."""
@@ -51,34 +69,35 @@ class LightStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
-                    vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
-                }
-            ),
+            data_schema=USER_STEP_SCHEMA,
             errors=self._errors,
         )
 
     async def _test_connection(self, host: str, port: int) -> bool:
         """Test if we can connect to the LightStack server."""
-        try:
-            session = async_create_clientsession(self.hass)
-            websocket = LightStackWebSocket(host, port, session)
-
-            # Try to connect
-            await websocket.connect()
+        session = async_get_clientsession(self.hass)
+        websocket = LightStackWebSocket(host, port, session)
 
-            # Disconnect after successful test
-            await websocket.disconnect()
+        try:
+            # Bound the whole probe so an unresponsive host cannot hold up
+            # the form beyond the connection timeout
+            async with asyncio.timeout(CONNECTION_TIMEOUT):
+                # Try to connect
+                await websocket.connect()
 
             return True
+        except TimeoutError:
+            _LOGGER.error("Timed out connecting to LightStack at %s:%s", host, port)
+            return False
         except LightStackConnectionError as err:
             _LOGGER.error("Failed to connect to LightStack: %s", err)
             return False
         except Exception as err:
             _LOGGER.exception("Unexpected error testing LightStack connection: %s", err)
             return False
+        finally:
+            # Always release the socket on HA's shared session
+            await websocket.disconnect()
 
     @staticmethod
     @callback
@@ -97,9 +116,13 @@ class LightStackOptionsFlowHandler(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Manage the options."""
         if user_input is not None:
+            # Saving unchanged options would still fire the update listener
+            entry = self.hass.config_entries.async_get_entry(self.handler)
+            if entry is not None and user_input == dict(entry.options):
+                return self.async_abort(reason="no_changes")
             return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({}),
+            data_schema=OPTIONS_SCHEMA,
         )
@@ -1,7 +1,10 @@
 """Constants for LightStack integration."""
 
+from types import MappingProxyType
 from typing import Final
 
+from homeassistant.const import Platform
+
 # Base component constants
 NAME: Final = "LightStack"
 DOMAIN: Final = "lightstack"
@@ -18,10 +21,7 @@ ICON_CLEAR_ALL: Final = "mdi:notification-clear-all"
 ICON_LED: Final = "mdi:led-on"
 
 # Platforms
-BINARY_SENSOR: Final = "binary_sensor"
-SENSOR: Final = "sensor"
-BUTTON: Final = "button"
-PLATFORMS: Final = [BINARY_SENSOR, SENSOR, BUTTON]
+PLATFORMS: Final = (Platform.BINARY_SENSOR, Platform.SENSOR, Platform.BUTTON)
 
 # Configuration
 CONF_HOST: Final = "host"
@@ -56,38 +56,42 @@ PRIORITY_MEDIUM: Final = 3
 PRIORITY_LOW: Final = 4
 PRIORITY_INFO: Final = 5
 
-PRIORITY_NAMES: Final = {
-    PRIORITY_CRITICAL: "Critical",
-    PRIORITY_HIGH: "High",
-    PRIORITY_MEDIUM: "Medium",
-    PRIORITY_LOW: "Low",
-    PRIORITY_INFO: "Info",
-}
+PRIORITY_NAMES: Final = MappingProxyType(
+    {
+        PRIORITY_CRITICAL: "Critical",
+        PRIORITY_HIGH: "High",
+        PRIORITY_MEDIUM: "Medium",
+        PRIORITY_LOW: "Low",
+        PRIORITY_INFO: "Info",
+    }
+)
 
 # LED Effects (Inovelli)
-LED_EFFECT_NAMES: Final = {
-    "off": "Off",
-    "solid": "Solid",
-    "fast_blink": "Fast Blink",
-    "slow_blink": "Slow Blink",
-    "pulse": "Pulse",
-    "chase": "Chase",
-    "open_close": "Open/Close",
-    "small_to_big": "Small to Big",
-    "aurora": "Aurora",
-    "slow_falling": "Slow Falling",
-    "medium_falling": "Medium Falling",
-    "fast_falling": "Fast Falling",
-    "slow_rising": "Slow Rising",
-    "medium_rising": "Medium Rising",
-    "fast_rising": "Fast Rising",
-    "medium_blink": "Medium Blink",
-    "slow_chase": "Slow Chase",
-    "fast_chase": "Fast Chase",
-    "fast_siren": "Fast Siren",
-    "slow_siren": "Slow Siren",
-    "clear_effect": "Clear Effect",
-}
+LED_EFFECT_NAMES: Final = MappingProxyType(
+    {
+        "off": "Off",
+        "solid": "Solid",
+        "fast_blink": "Fast Blink",
+        "slow_blink": "Slow Blink",
+        "pulse": "Pulse",
+        "chase": "Chase",
+        "open_close": "Open/Close",
+        "small_to_big": "Small to Big",
+        "aurora": "Aurora",
+        "slow_falling": "Slow Falling",
+        "medium_falling": "Medium Falling",
+        "fast_falling": "Fast Falling",
+        "slow_rising": "Slow Rising",
+        "medium_rising": "Medium Rising",
+        "fast_rising": "Fast Rising",
+        "medium_blink": "Medium Blink",
+        "slow_chase": "Slow Chase",
+        "fast_chase": "Fast Chase",
+        "fast_siren": "Fast Siren",
+        "slow_siren": "Slow Siren",
+        "clear_effect": "Clear Effect",
+    }
+)
 
 # Inovelli LED Color mapping (0-255)
 LED_COLOR_RED: Final = 0
@@ -100,17 +104,19 @@ LED_COLOR_PURPLE: Final = 212
 LED_COLOR_PINK: Final = 234
 LED_COLOR_WHITE: Final = 255
 
-LED_COLOR_NAMES: Final = {
-    LED_COLOR_RED: "Red",
-    LED_COLOR_ORANGE: "Orange",
-    LED_COLOR_YELLOW: "Yellow",
-    LED_COLOR_GREEN: "Green",
-    LED_COLOR_CYAN: "Cyan",
-    LED_COLOR_BLUE: "Blue",
-    LED_COLOR_PURPLE: "Purple",
-    LED_COLOR_PINK: "Pink",
-    LED_COLOR_WHITE: "White",
-}
+LED_COLOR_NAMES: Final = MappingProxyType(
+    {
+        LED_COLOR_RED: "Red",
+        LED_COLOR_ORANGE: "Orange",
+        LED_COLOR_YELLOW: "Yellow",
+        LED_COLOR_GREEN: "Green",
+        LED_COLOR_CYAN: "Cyan",
+        LED_COLOR_BLUE: "Blue",
+        LED_COLOR_PURPLE: "Purple",
+        LED_COLOR_PINK: "Pink",
+        LED_COLOR_WHITE: "White",
+    }
+)
 
 # Service names
 SERVICE_TRIGGER_ALERT: Final = "trigger_alert"
@@ -146,7 +152,13 @@ ERROR_UNKNOWN_COMMAND: Final = "UNKNOWN_COMMAND"
 
 # Reconnection settings
 RECONNECT_INTERVAL: Final = 5  # seconds
+MAX_RECONNECT_INTERVAL: Final = 60  # seconds
 CONNECTION_TIMEOUT: Final = 10  # seconds
+# aiohttp drops the connection after HEARTBEAT_INTERVAL / 2 without a pong
+HEARTBEAT_INTERVAL: Final = 30  # seconds
+
+# Command settings
+MAX_PENDING_COMMANDS: Final = 1024
 
 # State values
 STATE_ALL_CLEAR: Final = "All Clear"
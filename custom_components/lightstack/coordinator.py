@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import logging
+import random
 from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
@@ -12,6 +13,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     DOMAIN,
+    MAX_RECONNECT_INTERVAL,
     RECONNECT_INTERVAL,
     WS_EVENT_ALERT_CLEARED,
     WS_EVENT_ALERT_TRIGGERED,
@@ -22,8 +24,28 @@ from .websocket import LightStackConnectionError, LightStackWebSocket
 
 _LOGGER = logging.getLogger(__name__)
 
+# (field, default) pairs read from the top level of alert data
+_ALERT_FIELDS = (
+    ("alert_key", ""),
+    ("is_active", False),
+    ("effective_priority", 3),
+    ("priority", None),
+    ("last_triggered_at", None),
+)
+
+# (field, default) pairs that REST responses nest under the 'config' key
+_ALERT_CONFIG_FIELDS = (
+    ("name", None),
+    ("description", None),
+    ("default_priority", 3),
+    ("led_color", None),
+    ("led_effect", None),
+    ("led_brightness", None),
+    ("led_duration", None),
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class LightStackAlert:
     """Representation of a LightStack alert."""
 
@@ -47,54 +69,45 @@ class LightStackAlert:
         Handles both flat data (from WebSocket events) and nested config data
         (from REST API responses where config fields are nested in 'config' key).
         """
-        # Handle nested config data (from REST API responses)
-        # Use None as default (not {}) so empty dict doesn't cause issues
-        # (empty dict is truthy in Python, None is falsy)
-        config = data.get("config")
+        # Config fields prefer the nested 'config' dict when it has the key and
+        # fall back to the top-level data otherwise
+        config = data.get("config") or {}
 
-        # Helper to get value from config (if present) or top-level data
-        def get_field(field_name: str, default: Any = None) -> Any:
-            if config and field_name in config:
-                return config.get(field_name, default)
-            return data.get(field_name, default)
+        kwargs = {name: data.get(name, default) for name, default in _ALERT_FIELDS}
+        for name, default in _ALERT_CONFIG_FIELDS:
+            kwargs[name] = config[name] if name in config else data.get(name, default)
+        return cls(**kwargs)
 
-        return cls(
-            alert_key=data.get("alert_key", ""),
-            is_active=data.get("is_active", False),
-            effective_priority=data.get("effective_priority", 3),
-            priority=data.get("priority"),
-            last_triggered_at=data.get("last_triggered_at"),
-            name=get_field("name"),
-            description=get_field("description"),
-            default_priority=get_field("default_priority", 3),
-            led_color=get_field("led_color"),
-            led_effect=get_field("led_effect"),
-            led_brightness=get_field("led_brightness"),
-            led_duration=get_field("led_duration"),
-        )
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LightStackState:
     """Representation of LightStack state."""
 
     is_all_clear: bool = True
     current_alert: LightStackAlert | None = None
     active_count: int = 0
-    active_alerts: list[LightStackAlert] = field(default_factory=list)
+    active_alerts: tuple[LightStackAlert, ...] = ()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> LightStackState:
         """Create state from a dictionary."""
         current_alert_data = data.get("current_alert")
+        active_alerts_data = data.get("active_alerts", [])
+        if (
+            data.get("is_all_clear", True)
+            and not current_alert_data
+            and not active_alerts_data
+            and not data.get("active_count", 0)
+        ):
+            return _ALL_CLEAR_STATE
+
         current_alert = (
             LightStackAlert.from_dict(current_alert_data)
             if current_alert_data
             else None
         )
 
-        active_alerts_data = data.get("active_alerts", [])
-        active_alerts = [LightStackAlert.from_dict(a) for a in active_alerts_data]
+        active_alerts = tuple(LightStackAlert.from_dict(a) for a in active_alerts_data)
 
         return cls(
             is_all_clear=data.get("is_all_clear", True),
@@ -104,6 +117,11 @@ class LightStackState:
         )
 
 
+# Shared state for "nothing active"; its alerts are an immutable empty tuple,
+# so one instance can stand in for every all-clear update.
+_ALL_CLEAR_STATE = LightStackState()
+
+
 class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
     """Coordinator for LightStack WebSocket data updates."""
 
@@ -122,9 +140,13 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
         )
         self.websocket = websocket
         self.entry_id = entry_id
+        self.configuration_url = f"http://{websocket.host}:{websocket.port}/"
         self._remove_listener: callable | None = None
         self._maintain_task: asyncio.Task | None = None
         self._initial_state: LightStackState | None = None
+        # Active alerts indexed by alert_key, kept in sync with the latest state
+        self._alerts_by_key: dict[str, LightStackAlert] = {}
+        self._pending_state: LightStackState | None = None
 
     async def async_setup(self) -> bool:
         """Set up the coordinator.
@@ -136,7 +158,7 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             # Connect and get initial state
             initial_data = await self.websocket.connect()
             self._initial_state = LightStackState.from_dict(initial_data)
-            self.async_set_updated_data(self._initial_state)
+            self._async_set_state(self._initial_state)
 
             # Add event listener
             self._remove_listener = self.websocket.add_listener(self._handle_event)
@@ -148,6 +170,7 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             self._maintain_task = self.hass.async_create_background_task(
                 self._maintain_connection(),
                 "lightstack_connection_maintainer",
+                eager_start=True,
             )
 
             return True
@@ -157,20 +180,29 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             return False
 
     async def _maintain_connection(self) -> None:
-        """Maintain the WebSocket connection."""
-        while True:
-            await asyncio.sleep(RECONNECT_INTERVAL)
+        """Maintain the WebSocket connection.
 
-            if not self.websocket.connected:
-                _LOGGER.info("LightStack disconnected, attempting reconnection...")
-                await self._attempt_reconnect()
+        Wakes as soon as the connection drops instead of polling. Stale
+        connections are detected by the WebSocket heartbeat, which closes
+        the socket when the server stops answering pings.
+        """
+        failed_attempts = 0
+        while True:
+            if self.websocket.connected:
+                failed_attempts = 0
+                await self.websocket.wait_disconnected()
             else:
-                # Ping to verify connection is actually alive (detect stale connections)
-                if not await self.websocket.ping():
-                    _LOGGER.warning(
-                        "LightStack ping failed, connection appears stale. Reconnecting..."
-                    )
-                    await self._attempt_reconnect()
+                # The last reconnection attempt failed; back off exponentially,
+                # with jitter so several instances do not retry in lockstep
+                delay = min(
+                    MAX_RECONNECT_INTERVAL,
+                    RECONNECT_INTERVAL * 2 ** min(failed_attempts, 6),
+                )
+                failed_attempts += 1
+                await asyncio.sleep(delay + random.uniform(0, 1))
+
+            _LOGGER.info("LightStack disconnected, attempting reconnection...")
+            await self._attempt_reconnect()
 
     async def _attempt_reconnect(self) -> None:
         """Attempt to reconnect to LightStack."""
@@ -178,33 +210,66 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             initial_data = await self.websocket.reconnect()
             if initial_data is not None:
                 _LOGGER.info("Successfully reconnected to LightStack")
-                self.async_set_updated_data(LightStackState.from_dict(initial_data))
+                self._async_set_state(LightStackState.from_dict(initial_data))
         except Exception as err:
             _LOGGER.warning("Failed to reconnect to LightStack: %s", err)
 
+    @callback
+    def _async_set_state(self, state: LightStackState) -> None:
+        """Replace the full state, e.g. after (re)connecting.
+
+        Any coalesced event update still waiting to be published is
+        superseded. A reconnect usually reports the state we already hold;
+        in that case nothing is published.
+        """
+        self._pending_state = None
+        self._alerts_by_key = {alert.alert_key: alert for alert in state.active_alerts}
+        if state == self.data:
+            return
+        self.async_set_updated_data(state)
+
+    @property
+    def _latest_state(self) -> LightStackState | None:
+        """Return the newest state, including a not yet published one."""
+        if self._pending_state is not None:
+            return self._pending_state
+        return self.data
+
+    @callback
+    def _async_publish(self, state: LightStackState) -> None:
+        """Publish an event-driven state update unless nothing changed.
+
+        Duplicate or echoed events produce an equal state and are dropped.
+        Updates are coalesced until the next event-loop iteration, so a
+        burst of events wakes the listening entities once with the final
+        state.
+        """
+        if state == self._latest_state:
+            return
+        if self._pending_state is None:
+            self.hass.loop.call_soon(self._async_flush)
+        self._pending_state = state
+
+    @callback
+    def _async_flush(self) -> None:
+        """Publish the coalesced state update, if still pending."""
+        state, self._pending_state = self._pending_state, None
+        if state is not None and state != self.data:
+            self.async_set_updated_data(state)
+
     @callback
     def _handle_event(self, event_type: str, event_data: dict[str, Any]) -> None:
         """Handle WebSocket events."""
-        _LOGGER.debug(
-            "Handling LightStack event: %s with data keys: %s",
-            event_type,
-            list(event_data.keys()) if event_data else "None",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Handling LightStack event: %s with data keys: %s",
+                event_type,
+                list(event_data.keys()) if event_data else "None",
+            )
 
-        if event_type == WS_EVENT_CURRENT_ALERT_CHANGED:
-            self._handle_current_alert_changed(event_data)
-        elif event_type == WS_EVENT_ALERT_TRIGGERED:
-            self._handle_alert_triggered(event_data)
-        elif event_type == WS_EVENT_ALERT_CLEARED:
-            self._handle_alert_cleared(event_data)
-        elif event_type == WS_EVENT_ALL_ALERTS_CLEARED:
-            self._handle_all_alerts_cleared(event_data)
-        elif event_type == "reconnected":
-            # Handle reconnection with new state
-            state_data = event_data.get("state", {})
-            self.async_set_updated_data(LightStackState.from_dict(state_data))
-        elif event_type == "disconnected":
-            _LOGGER.warning("LightStack WebSocket disconnected")
+        handler = self._EVENT_HANDLERS.get(event_type)
+        if handler is not None:
+            handler(self, event_data)
 
     def _handle_current_alert_changed(self, event_data: dict[str, Any]) -> None:
         """Handle current_alert_changed event."""
@@ -213,50 +278,41 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             LightStackAlert.from_dict(current_data) if current_data else None
         )
 
+        latest = self._latest_state
         new_state = LightStackState(
             is_all_clear=event_data.get("is_all_clear", True),
             current_alert=current_alert,
             active_count=event_data.get("active_count", 0),
-            active_alerts=self.data.active_alerts if self.data else [],
+            active_alerts=latest.active_alerts if latest else (),
         )
-        self.async_set_updated_data(new_state)
+        self._async_publish(new_state)
 
     def _handle_alert_triggered(self, event_data: dict[str, Any]) -> None:
         """Handle alert_triggered event."""
-        _LOGGER.debug(
-            "Processing alert_triggered: current_changed=%s, alert_key=%s, new_current=%s",
-            event_data.get("current_changed"),
-            (
-                event_data.get("alert", {}).get("alert_key")
-                if event_data.get("alert")
-                else None
-            ),
-            (
-                event_data.get("new_current", {}).get("alert_key")
-                if event_data.get("new_current")
-                else None
-            ),
-        )
-
-        # Update active alerts list with the triggered alert
-        alert_data = event_data.get("alert")
-        triggered_alert = LightStackAlert.from_dict(alert_data) if alert_data else None
-
-        active_alerts = list(self.data.active_alerts) if self.data else []
-        if triggered_alert:
-            # Add or update the alert in the list
-            existing_idx = next(
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "Processing alert_triggered: current_changed=%s, alert_key=%s, new_current=%s",
+                event_data.get("current_changed"),
+                (
+                    event_data.get("alert", {}).get("alert_key")
+                    if event_data.get("alert")
+                    else None
+                ),
                 (
-                    i
-                    for i, a in enumerate(active_alerts)
-                    if a.alert_key == triggered_alert.alert_key
+                    event_data.get("new_current", {}).get("alert_key")
+                    if event_data.get("new_current")
+                    else None
                 ),
-                None,
             )
-            if existing_idx is not None:
-                active_alerts[existing_idx] = triggered_alert
-            else:
-                active_alerts.append(triggered_alert)
+
+        # Add or update the triggered alert; re-assigning an existing key keeps
+        # its position in the active list
+        alert_data = event_data.get("alert")
+        if alert_data:
+            triggered_alert = LightStackAlert.from_dict(alert_data)
+            self._alerts_by_key[triggered_alert.alert_key] = triggered_alert
+        active_alerts = tuple(self._alerts_by_key.values())
 
         # Update current alert only if it changed
         if event_data.get("current_changed", False):
@@ -268,7 +324,8 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             )
         else:
             # Keep existing current alert
-            new_current = self.data.current_alert if self.data else None
+            latest = self._latest_state
+            new_current = latest.current_alert if latest else None
 
         # Always update state to ensure sensor reflects the triggered alert
         new_state = LightStackState(
@@ -277,13 +334,14 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             active_count=len(active_alerts),
             active_alerts=active_alerts,
         )
-        _LOGGER.debug(
-            "Setting new state: is_all_clear=%s, current_alert=%s, active_count=%d",
-            new_state.is_all_clear,
-            new_state.current_alert.alert_key if new_state.current_alert else None,
-            new_state.active_count,
-        )
-        self.async_set_updated_data(new_state)
+        if debug:
+            _LOGGER.debug(
+                "Setting new state: is_all_clear=%s, current_alert=%s, active_count=%d",
+                new_state.is_all_clear,
+                new_state.current_alert.alert_key if new_state.current_alert else None,
+                new_state.active_count,
+            )
+        self._async_publish(new_state)
 
     def _handle_alert_cleared(self, event_data: dict[str, Any]) -> None:
         """Handle alert_cleared event."""
@@ -297,9 +355,11 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
         alert_data = event_data.get("alert")
         cleared_key = alert_data.get("alert_key") if alert_data else None
 
-        active_alerts = list(self.data.active_alerts) if self.data else []
-        if cleared_key:
-            active_alerts = [a for a in active_alerts if a.alert_key != cleared_key]
+        # Reuse the published tuple when the cleared alert was not active
+        latest = self._latest_state
+        active_alerts = latest.active_alerts if latest else ()
+        if cleared_key and self._alerts_by_key.pop(cleared_key, None) is not None:
+            active_alerts = tuple(self._alerts_by_key.values())
 
         new_state = LightStackState(
             is_all_clear=new_current is None,
@@ -307,17 +367,31 @@ class LightStackCoordinator(DataUpdateCoordinator[LightStackState]):
             active_count=len(active_alerts),
             active_alerts=active_alerts,
         )
-        self.async_set_updated_data(new_state)
+        self._async_publish(new_state)
 
     def _handle_all_alerts_cleared(self, event_data: dict[str, Any]) -> None:
         """Handle all_alerts_cleared event."""
-        new_state = LightStackState(
-            is_all_clear=True,
-            current_alert=None,
-            active_count=0,
-            active_alerts=[],
-        )
-        self.async_set_updated_data(new_state)
+        self._alerts_by_key.clear()
+        self._async_publish(_ALL_CLEAR_STATE)
+
+    def _handle_reconnected(self, event_data: dict[str, Any]) -> None:
+        """Handle reconnection with new state."""
+        state_data = event_data.get("state", {})
+        self._async_set_state(LightStackState.from_dict(state_data))
+
+    def _handle_disconnected(self, event_data: dict[str, Any]) -> None:
+        """Handle WebSocket disconnection."""
+        _LOGGER.warning("LightStack WebSocket disconnected")
+
+    # Event type to handler dispatch table, looked up once per event
+    _EVENT_HANDLERS = {
+        WS_EVENT_CURRENT_ALERT_CHANGED: _handle_current_alert_changed,
+        WS_EVENT_ALERT_TRIGGERED: _handle_alert_triggered,
+        WS_EVENT_ALERT_CLEARED: _handle_alert_cleared,
+        WS_EVENT_ALL_ALERTS_CLEARED: _handle_all_alerts_cleared,
+        "reconnected": _handle_reconnected,
+        "disconnected": _handle_disconnected,
+    }
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
@@ -22,18 +22,11 @@ class LightStackEntity(CoordinatorEntity[LightStackCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._entry_id = entry_id
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this LightStack instance."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
             name=NAME,
             manufacturer=MANUFACTURER,
             model="Alert Manager",
             sw_version=VERSION,
-            configuration_url=(
-                f"http://{self.coordinator.websocket._host}"
-                f":{self.coordinator.websocket._port}/"
-            ),
+            configuration_url=coordinator.configuration_url,
         )
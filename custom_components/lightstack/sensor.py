@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -35,6 +36,9 @@ from .const import (
 from .coordinator import LightStackCoordinator
 from .entity import LightStackEntity
 
+# Known LED color values in ascending order for nearest-match lookups
+_SORTED_COLOR_VALUES = tuple(sorted(LED_COLOR_NAMES))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,43 +64,41 @@ class LightStackCurrentAlertSensor(LightStackEntity, SensorEntity):
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_current_alert"
 
-    @property
-    def native_value(self) -> str:
-        """Return the current alert name or 'All Clear'."""
-        if self.coordinator.data is None:
-            return STATE_ALL_CLEAR
-
-        if self.coordinator.data.is_all_clear:
-            return STATE_ALL_CLEAR
-
-        alert = self.coordinator.data.current_alert
-        if alert is None:
-            return STATE_ALL_CLEAR
-
-        return alert.name or alert.alert_key
-
-    @property
-    def icon(self) -> str:
-        """Return the icon based on alert status."""
-        if self.coordinator.data is None or self.coordinator.data.is_all_clear:
-            return ICON_CHECK_CIRCLE
-        return ICON_ALERT
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        if self.coordinator.data is None:
-            return {
+    async def async_added_to_hass(self) -> None:
+        """Compute the cached attributes before the first state write."""
+        self._update_attrs()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        """Cache the state, icon and attributes for the current data."""
+        data = self.coordinator.data
+        if data is None:
+            self._attr_native_value = STATE_ALL_CLEAR
+            self._attr_icon = ICON_CHECK_CIRCLE
+            self._attr_extra_state_attributes = {
                 ATTR_IS_ALL_CLEAR: True,
                 ATTR_ACTIVE_COUNT: 0,
             }
-
-        attrs = {
-            ATTR_IS_ALL_CLEAR: self.coordinator.data.is_all_clear,
-            ATTR_ACTIVE_COUNT: self.coordinator.data.active_count,
+            return
+
+        alert = data.current_alert
+        if data.is_all_clear or alert is None:
+            self._attr_native_value = STATE_ALL_CLEAR
+        else:
+            self._attr_native_value = alert.name or alert.alert_key
+        self._attr_icon = ICON_CHECK_CIRCLE if data.is_all_clear else ICON_ALERT
+
+        attrs: dict[str, Any] = {
+            ATTR_IS_ALL_CLEAR: data.is_all_clear,
+            ATTR_ACTIVE_COUNT: data.active_count,
         }
 
-        alert = self.coordinator.data.current_alert
         if alert is not None:
             attrs[ATTR_ALERT_KEY] = alert.alert_key
             attrs[ATTR_EFFECTIVE_PRIORITY] = alert.effective_priority
@@ -117,7 +119,7 @@ class LightStackCurrentAlertSensor(LightStackEntity, SensorEntity):
             attrs[ATTR_LAST_TRIGGERED] = alert.last_triggered_at
             attrs[ATTR_DESCRIPTION] = alert.description
 
-        return attrs
+        self._attr_extra_state_attributes = attrs
 
     def _get_color_name(self, color_value: int | None) -> str | None:
         """Get the color name for a color value."""
@@ -128,8 +130,15 @@ class LightStackCurrentAlertSensor(LightStackEntity, SensorEntity):
         if color_value in LED_COLOR_NAMES:
             return LED_COLOR_NAMES[color_value]
 
-        # Find the closest match
-        closest_color = min(LED_COLOR_NAMES.keys(), key=lambda x: abs(x - color_value))
+        # Find the closest match; ties go to the lower color value
+        idx = bisect_left(_SORTED_COLOR_VALUES, color_value)
+        if idx == 0:
+            return LED_COLOR_NAMES[_SORTED_COLOR_VALUES[0]]
+        if idx == len(_SORTED_COLOR_VALUES):
+            return LED_COLOR_NAMES[_SORTED_COLOR_VALUES[-1]]
+        lower = _SORTED_COLOR_VALUES[idx - 1]
+        upper = _SORTED_COLOR_VALUES[idx]
+        closest_color = lower if color_value - lower <= upper - color_value else upper
         return LED_COLOR_NAMES[closest_color]
 
     def _get_effect_name(self, effect_value: str | None) -> str | None:
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 import logging
-from typing import Any, Callable
-import uuid
+from typing import Any, Awaitable, Callable
 
 import aiohttp
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONNECTION_TIMEOUT,
+    HEARTBEAT_INTERVAL,
+    MAX_PENDING_COMMANDS,
     RECONNECT_INTERVAL,
     WS_CMD_CLEAR_ALERT,
     WS_CMD_CLEAR_ALL_ALERTS,
@@ -23,6 +27,30 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Message types that end the receive loop
+_CLOSE_MSG_TYPES = frozenset(
+    {
+        aiohttp.WSMsgType.CLOSE,
+        aiohttp.WSMsgType.CLOSED,
+        aiohttp.WSMsgType.CLOSING,
+    }
+)
+
+# Read-only commands whose concurrent calls can share a single request
+_COALESCED_COMMANDS = frozenset({WS_CMD_PING, WS_CMD_GET_STATE})
+
+# Connection states; only _STATE_OPEN counts as connected
+_STATE_CLOSED = 0
+_STATE_CONNECTING = 1
+_STATE_OPEN = 2
+_STATE_CLOSING = 3
+
+# Pre-serialized frames for commands sent without data; only the id varies
+_COMMAND_TEMPLATES = {
+    command_type: json_dumps({"type": command_type, "id": "%s"})
+    for command_type in (WS_CMD_PING, WS_CMD_GET_STATE, WS_CMD_CLEAR_ALL_ALERTS)
+}
+
 
 class LightStackWebSocketError(Exception):
     """Exception for LightStack WebSocket errors."""
@@ -56,13 +84,40 @@ class LightStackWebSocket:
         self._port = port
         self._session = session
         self._ws: aiohttp.ClientWebSocketResponse | None = None
-        self._listeners: list[Callable[[str, dict[str, Any]], None]] = []
+        # Listeners split by kind at registration; dicts keep insertion order
+        # and allow O(1) removal
+        self._sync_listeners: dict[Callable[[str, dict[str, Any]], None], None] = {}
+        self._async_listeners: dict[
+            Callable[[str, dict[str, Any]], Awaitable[None]], None
+        ] = {}
         self._pending_commands: dict[str, asyncio.Future] = {}
-        self._running = False
+        # Command ids only need to be unique for this client's replies
+        self._command_seq = 0
+        # In-flight coalesced commands, keyed by command type and timeout
+        self._inflight: dict[tuple[str, float], asyncio.Task] = {}
+        # Server messages handled by the client itself rather than listeners
+        self._message_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            WS_EVENT_COMMAND_RESULT: self._on_command_result,
+            WS_EVENT_ERROR: self._on_error,
+        }
+        self._state = _STATE_CLOSED
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._listen_task: asyncio.Task | None = None
         self._reconnect_task: asyncio.Task | None = None
-        self._connected = False
         self._server_version: str | None = None
+        # Set whenever there is no live connection
+        self._disconnected = asyncio.Event()
+        self._disconnected.set()
+
+    @property
+    def host(self) -> str:
+        """Return the LightStack server host."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Return the LightStack server port."""
+        return self._port
 
     @property
     def url(self) -> str:
@@ -72,7 +127,7 @@ class LightStackWebSocket:
     @property
     def connected(self) -> bool:
         """Return True if connected to the WebSocket."""
-        return self._connected and self._ws is not None and not self._ws.closed
+        return self._state == _STATE_OPEN
 
     @property
     def server_version(self) -> str | None:
@@ -88,14 +143,18 @@ class LightStackWebSocket:
         Raises:
             LightStackConnectionError: If connection fails.
         """
+        self._state = _STATE_CONNECTING
         try:
             _LOGGER.debug("Connecting to LightStack WebSocket at %s", self.url)
             self._ws = await asyncio.wait_for(
-                self._session.ws_connect(self.url),
+                # Let aiohttp send protocol-level pings; it closes the socket
+                # when a pong is missed, which ends the listener
+                self._session.ws_connect(
+                    self.url, heartbeat=HEARTBEAT_INTERVAL, autoping=True
+                ),
                 timeout=CONNECTION_TIMEOUT,
             )
-            self._connected = True
-            self._running = True
+            self._loop = asyncio.get_running_loop()
 
             # Wait for connection_established message
             initial_msg = await asyncio.wait_for(
@@ -103,139 +162,203 @@ class LightStackWebSocket:
                 timeout=CONNECTION_TIMEOUT,
             )
 
-            if initial_msg.type == aiohttp.WSMsgType.TEXT:
-                data = initial_msg.json()
-                if data.get("type") == "connection_established":
-                    event_data = data.get("data", {})
-                    self._server_version = event_data.get("server_version")
-                    _LOGGER.info(
-                        "Connected to LightStack server version %s",
-                        self._server_version,
-                    )
-                    return event_data.get("state", {})
+            if initial_msg.type != aiohttp.WSMsgType.TEXT:
+                raise LightStackConnectionError(
+                    f"Unexpected WebSocket message type: {initial_msg.type}"
+                )
+            try:
+                data = json_loads(initial_msg.data)
+            except ValueError as err:
+                raise LightStackConnectionError(
+                    f"Invalid initial message from LightStack: {initial_msg.data}"
+                ) from err
+            if data.get("type") != "connection_established":
                 raise LightStackConnectionError(
                     f"Unexpected initial message type: {data.get('type')}"
                 )
-            raise LightStackConnectionError(
-                f"Unexpected WebSocket message type: {initial_msg.type}"
+
+            event_data = data.get("data", {})
+            self._server_version = event_data.get("server_version")
+            _LOGGER.info(
+                "Connected to LightStack server version %s",
+                self._server_version,
             )
+            # Only a validated handshake counts as connected
+            self._state = _STATE_OPEN
+            self._disconnected.clear()
+            return event_data.get("state", {})
 
         except asyncio.TimeoutError as err:
-            self._connected = False
+            await self._async_abort_connect()
             raise LightStackConnectionError(
                 f"Timeout connecting to LightStack at {self.url}"
             ) from err
         except aiohttp.ClientError as err:
-            self._connected = False
+            await self._async_abort_connect()
             raise LightStackConnectionError(
                 f"Failed to connect to LightStack at {self.url}: {err}"
             ) from err
+        except BaseException:
+            await self._async_abort_connect()
+            raise
+
+    async def _async_abort_connect(self) -> None:
+        """Tear down a connection attempt that did not complete."""
+        self._state = _STATE_CLOSED
+        self._disconnected.set()
+        ws, self._ws = self._ws, None
+        if ws is not None and not ws.closed:
+            await ws.close()
+
+    async def wait_disconnected(self) -> None:
+        """Wait until the connection is lost or closed."""
+        await self._disconnected.wait()
 
     async def start_listening(self) -> None:
         """Start listening for WebSocket messages."""
         if self._listen_task is not None and not self._listen_task.done():
             return
 
-        self._listen_task = asyncio.create_task(self._listen())
+        self._listen_task = self._loop.create_task(self._listen())
 
     async def _listen(self) -> None:
         """Listen for incoming WebSocket messages."""
         if self._ws is None:
             return
 
+        # Bind hot lookups once; this loop runs for every incoming frame
+        ws = self._ws
+        receive = ws.receive
+        handle_message = self._handle_message
+        loads = json_loads
+        msg_text = aiohttp.WSMsgType.TEXT
+        msg_error = aiohttp.WSMsgType.ERROR
+        msg_closed = _CLOSE_MSG_TYPES
+
         try:
-            async for msg in self._ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+            while True:
+                msg = await receive()
+                msg_type = msg.type
+                if msg_type is msg_text:
                     try:
-                        data = msg.json()
-                        await self._handle_message(data)
+                        pending = handle_message(loads(msg.data))
+                        if pending is not None:
+                            await pending
                     except ValueError:
                         _LOGGER.error("Failed to parse WebSocket message: %s", msg.data)
-                elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error(
-                        "WebSocket error: %s",
-                        self._ws.exception() if self._ws else "Unknown",
-                    )
-                    break
-                elif msg.type in (
-                    aiohttp.WSMsgType.CLOSE,
-                    aiohttp.WSMsgType.CLOSED,
-                    aiohttp.WSMsgType.CLOSING,
-                ):
+                elif msg_type in msg_closed:
                     _LOGGER.debug("WebSocket connection closed")
                     break
+                elif msg_type is msg_error:
+                    _LOGGER.error("WebSocket error: %s", ws.exception())
+                    break
         except Exception as err:
             _LOGGER.error("Error in WebSocket listener: %s", err)
         finally:
-            self._connected = False
+            # disconnect() owns the transition if it is already closing
+            if self._state == _STATE_OPEN:
+                self._state = _STATE_CLOSED
+            self._disconnected.set()
             # Notify listeners of disconnection
-            await self._notify_listeners("disconnected", {})
+            if (pending := self._notify_listeners("disconnected", {})) is not None:
+                await pending
+
+    def _handle_message(self, data: dict[str, Any]) -> Awaitable[None] | None:
+        """Handle an incoming WebSocket message.
 
-    async def _handle_message(self, data: dict[str, Any]) -> None:
-        """Handle an incoming WebSocket message."""
+        Returns an awaitable only when async listeners have to be awaited, so
+        command results and sync-only events never schedule a coroutine.
+        """
         event_type = data.get("type", "")
         event_data = data.get("data", {})
 
         _LOGGER.debug("Received WebSocket message: %s", event_type)
 
-        # Handle command responses
-        if event_type == WS_EVENT_COMMAND_RESULT:
-            command_id = event_data.get("command_id")
-            if command_id and command_id in self._pending_commands:
-                future = self._pending_commands.pop(command_id)
-                if not future.done():
-                    future.set_result(event_data)
-            return
+        handler = self._message_handlers.get(event_type)
+        if handler is not None:
+            handler(event_data)
+            return None
 
-        # Handle errors
-        if event_type == WS_EVENT_ERROR:
-            command_id = event_data.get("command_id")
-            if command_id and command_id in self._pending_commands:
-                future = self._pending_commands.pop(command_id)
-                if not future.done():
-                    future.set_exception(
-                        LightStackCommandError(
-                            event_data.get("code", "UNKNOWN"),
-                            event_data.get("message", "Unknown error"),
-                        )
+        # Notify listeners of other events
+        return self._notify_listeners(event_type, event_data)
+
+    def _on_command_result(self, event_data: dict[str, Any]) -> None:
+        """Resolve the pending command a result belongs to."""
+        future = self._pending_commands.pop(event_data.get("command_id"), None)
+        if future is not None and not future.done():
+            future.set_result(event_data)
+
+    def _on_error(self, event_data: dict[str, Any]) -> None:
+        """Fail the pending command an error belongs to, or log it."""
+        future = self._pending_commands.pop(event_data.get("command_id"), None)
+        if future is not None:
+            if not future.done():
+                future.set_exception(
+                    LightStackCommandError(
+                        event_data.get("code", "UNKNOWN"),
+                        event_data.get("message", "Unknown error"),
                     )
-            else:
-                _LOGGER.error(
-                    "LightStack error: %s - %s",
-                    event_data.get("code"),
-                    event_data.get("message"),
                 )
-            return
-
-        # Notify listeners of other events
-        await self._notify_listeners(event_type, event_data)
+        else:
+            _LOGGER.error(
+                "LightStack error: %s - %s",
+                event_data.get("code"),
+                event_data.get("message"),
+            )
 
-    async def _notify_listeners(
+    def _notify_listeners(
         self, event_type: str, event_data: dict[str, Any]
-    ) -> None:
-        """Notify all listeners of an event."""
-        for listener in self._listeners:
+    ) -> Awaitable[None] | None:
+        """Notify all listeners of an event.
+
+        Sync listeners are called immediately; an awaitable is returned only
+        if there are async listeners to run.
+        """
+        # Iterate over snapshots so listeners may remove themselves
+        for listener in tuple(self._sync_listeners):
             try:
-                if asyncio.iscoroutinefunction(listener):
-                    await listener(event_type, event_data)
-                else:
-                    listener(event_type, event_data)
+                listener(event_type, event_data)
             except Exception as err:
                 _LOGGER.error("Error in WebSocket listener callback: %s", err)
 
+        if not self._async_listeners:
+            return None
+
+        return self._notify_async_listeners(event_type, event_data)
+
+    async def _notify_async_listeners(
+        self, event_type: str, event_data: dict[str, Any]
+    ) -> None:
+        """Run the async listeners for an event."""
+        # Run async listeners concurrently so a slow one does not delay others
+        results = await asyncio.gather(
+            *(
+                async_listener(event_type, event_data)
+                for async_listener in tuple(self._async_listeners)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Error in WebSocket listener callback: %s", result)
+
     def add_listener(
-        self, callback: Callable[[str, dict[str, Any]], None]
+        self, callback: Callable[[str, dict[str, Any]], Any]
     ) -> Callable[[], None]:
         """Add a listener for WebSocket events.
 
         Returns:
             A function to remove the listener.
         """
-        self._listeners.append(callback)
+        listeners: dict[Callable[[str, dict[str, Any]], Any], None]
+        if asyncio.iscoroutinefunction(callback):
+            listeners = self._async_listeners
+        else:
+            listeners = self._sync_listeners
+        listeners[callback] = None
 
         def remove_listener() -> None:
-            if callback in self._listeners:
-                self._listeners.remove(callback)
+            listeners.pop(callback, None)
 
         return remove_listener
 
@@ -264,22 +387,62 @@ class LightStackWebSocket:
         if not self.connected:
             raise LightStackConnectionError("Not connected to LightStack")
 
-        command_id = str(uuid.uuid4())
-        message: dict[str, Any] = {
-            "type": command_type,
-            "id": command_id,
-        }
-        if data:
-            message["data"] = data
+        if wait_for_result and not data and command_type in _COALESCED_COMMANDS:
+            # Callers arriving while the same read is in flight with the same
+            # timeout share its result; the shield keeps one caller's
+            # cancellation from cancelling the request for the others
+            key = (command_type, timeout)
+            task = self._inflight.get(key)
+            if task is None:
+                task = self._loop.create_task(
+                    self._send_command(command_type, None, True, timeout)
+                )
+                self._inflight[key] = task
+                task.add_done_callback(partial(self._on_inflight_done, key))
+            return await asyncio.shield(task)
+
+        return await self._send_command(command_type, data, wait_for_result, timeout)
+
+    def _on_inflight_done(
+        self, key: tuple[str, float], task: asyncio.Task[dict[str, Any] | None]
+    ) -> None:
+        """Forget a finished coalesced command."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller went away
+            task.exception()
+
+    async def _send_command(
+        self,
+        command_type: str,
+        data: dict[str, Any] | None,
+        wait_for_result: bool,
+        timeout: float,
+    ) -> dict[str, Any] | None:
+        """Send a command to the server and optionally wait for its result."""
+        self._command_seq += 1
+        command_id = f"c{self._command_seq}"
 
         _LOGGER.debug("Sending command: %s (id: %s)", command_type, command_id)
 
         if wait_for_result:
-            future: asyncio.Future[dict[str, Any]] = asyncio.Future()
+            future: asyncio.Future[dict[str, Any]] = self._loop.create_future()
             self._pending_commands[command_id] = future
+            if len(self._pending_commands) > MAX_PENDING_COMMANDS:
+                self._evict_oldest_command()
 
         try:
-            await self._ws.send_json(message)
+            template = None if data else _COMMAND_TEMPLATES.get(command_type)
+            if template is not None:
+                await self._ws.send_str(template % command_id)
+            else:
+                message: dict[str, Any] = {
+                    "type": command_type,
+                    "id": command_id,
+                }
+                if data:
+                    message["data"] = data
+                await self._ws.send_json(message, dumps=json_dumps)
 
             if wait_for_result:
                 return await asyncio.wait_for(future, timeout=timeout)
@@ -290,9 +453,33 @@ class LightStackWebSocket:
             raise LightStackCommandError(
                 "TIMEOUT", f"Command {command_type} timed out"
             ) from None
+        except (aiohttp.ClientError, ConnectionError) as err:
+            # The socket can close before the listener marks the client closed
+            self._pending_commands.pop(command_id, None)
+            raise LightStackConnectionError(
+                f"Failed to send {command_type} to LightStack: {err}"
+            ) from err
+
+    def _evict_oldest_command(self) -> None:
+        """Fail the oldest pending command to keep the backlog bounded.
+
+        Guards against a server that silently drops replies; dicts keep
+        insertion order, so the first key is the oldest command.
+        """
+        command_id = next(iter(self._pending_commands))
+        future = self._pending_commands.pop(command_id)
+        if not future.done():
+            future.set_exception(
+                LightStackCommandError(
+                    "TOO_MANY_PENDING",
+                    f"Command {command_id} dropped: too many pending commands",
+                )
+            )
 
     async def ping(self) -> bool:
-        """Send a ping command to check connection health.
+        """Send a ping command as an explicit health probe.
+
+        Routine liveness is handled by the WebSocket heartbeat.
 
         Returns:
             True if ping was successful.
@@ -378,28 +565,28 @@ class LightStackWebSocket:
 
     async def disconnect(self) -> None:
         """Disconnect from the WebSocket."""
-        self._running = False
-        self._connected = False
+        self._state = _STATE_CLOSING
+        self._disconnected.set()
 
-        # Cancel pending commands
-        for command_id, future in list(self._pending_commands.items()):
-            if not future.done():
-                future.cancel()
-        self._pending_commands.clear()
+        # Cancel pending commands; swap in a fresh dict first so nothing can
+        # register against the old one while it is being drained
+        pending, self._pending_commands = self._pending_commands, {}
+        for future in pending.values():
+            future.cancel()
 
         # Cancel listen task
-        if self._listen_task is not None and not self._listen_task.done():
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
-            self._listen_task = None
+        listen_task, self._listen_task = self._listen_task, None
+        if listen_task is not None and not listen_task.done():
+            listen_task.cancel()
+            # Collects the task's CancelledError without swallowing a
+            # cancellation of disconnect() itself
+            await asyncio.gather(listen_task, return_exceptions=True)
 
         # Close WebSocket
         if self._ws is not None and not self._ws.closed:
             await self._ws.close()
         self._ws = None
+        self._state = _STATE_CLOSED
 
         _LOGGER.debug("Disconnected from LightStack WebSocket")
 
@@ -420,23 +607,23 @@ class LightStackWebSocket:
             return None
 
     async def maintain_connection(self) -> None:
-        """Maintain the WebSocket connection with automatic reconnection."""
-        while self._running:
+        """Maintain the WebSocket connection with automatic reconnection.
+
+        Runs until cancelled.
+        """
+        while True:
             if not self.connected:
                 _LOGGER.info("Attempting to reconnect to LightStack...")
                 initial_state = await self.reconnect()
                 if initial_state is not None:
-                    await self._notify_listeners(
+                    pending = self._notify_listeners(
                         "reconnected", {"state": initial_state}
                     )
+                    if pending is not None:
+                        await pending
                 else:
                     await asyncio.sleep(RECONNECT_INTERVAL)
                     continue
 
-            # Wait for disconnection or check periodically
-            await asyncio.sleep(RECONNECT_INTERVAL)
-
-            # Ping to verify connection is still alive
-            if self.connected and not await self.ping():
-                _LOGGER.warning("LightStack connection appears dead, reconnecting...")
-                self._connected = False
+            # The heartbeat closes stale connections, so just wait for that
+            await self.wait_disconnected()